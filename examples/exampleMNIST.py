@@ -1,9 +1,9 @@
 import torch
 from torchvision import datasets, transforms
-from collections import OrderedDict
 from multiviewae import mcVAE, DVCCA
 import matplotlib.pyplot as plt #NOTE: matplotlib is not installed with the library and must be installed separately
-import pandas as pd
+from matplotlib.colors import ListedColormap
+from matplotlib.patches import Patch
 
 #Load the MNIST data
 MNIST_1 = datasets.MNIST('./data/MNIST', train=True, download=True, transform=transforms.Compose([
@@ -63,26 +63,24 @@ colors = {0: 'tab:blue',
         8: 'tab:pink',
         9: 'tab:gray'
         }
+cmap = ListedColormap(list(colors.values()))
+legend_handles = [Patch(color=c, label=str(j)) for j, c in colors.items()]
 fig=plt.figure(figsize=(8,6)) 
 ax1 = fig.add_subplot(1, 1, 1)
-ax1.scatter(dvcca_latent[0][:,0], dvcca_latent[0][:,1], c=pd.Series(target_test).map(colors))
+ax1.scatter(dvcca_latent[0][:,0], dvcca_latent[0][:,1], c=target_test, cmap=cmap, vmin=0, vmax=9)
 ax1.set_title('DVCCA latent vectors')
-handles, labels = plt.gca().get_legend_handles_labels()
-by_label = OrderedDict(zip(labels, handles))
-plt.legend(by_label.values(), by_label.keys())
+plt.legend(handles=legend_handles)
 plt.tight_layout()
 plt.show()
 
 fig=plt.figure(figsize=(8,6)) 
 ax1 = fig.add_subplot(1, 2, 1)
-ax1.scatter(mcvae_latent[0][:,0], mcvae_latent[0][:,1], c=pd.Series(target_test).map(colors))
+ax1.scatter(mcvae_latent[0][:,0], mcvae_latent[0][:,1], c=target_test, cmap=cmap, vmin=0, vmax=9)
 ax1.set_title('mcVAE latent vectors view 1')
 ax2 = fig.add_subplot(1, 2, 2)
-ax2.scatter(mcvae_latent[1][:,0], mcvae_latent[1][:,1], c=pd.Series(target_test).map(colors))
+ax2.scatter(mcvae_latent[1][:,0], mcvae_latent[1][:,1], c=target_test, cmap=cmap, vmin=0, vmax=9)
 ax2.set_title('mcVAE latent vectors view 2')
-handles, labels = plt.gca().get_legend_handles_labels()
-by_label = OrderedDict(zip(labels, handles))
-plt.legend(by_label.values(), by_label.keys())
+plt.legend(handles=legend_handles)
 plt.tight_layout()
 plt.show()
 
@@ -1,11 +1,11 @@
 import torch
 import torch.nn.functional as F
 from torchvision import datasets, transforms
-from collections import OrderedDict
 from multiviewae.models import mmVAE
 import matplotlib.pyplot as plt
 import umap
-import pandas as pd
+from matplotlib.colors import ListedColormap
+from matplotlib.patches import Patch
 
 #Load the MNIST data
 MNIST_1 = datasets.MNIST('./data/MNIST', train=True, download=True, transform=transforms.Compose([
@@ -60,6 +60,8 @@ axarr[1].imshow(pred_sample.reshape(28,28))
 
 colors = {0: 'tab:blue', 1:'tab:orange', 2: 'r', 3: 'c', 4: 'm', 5: 'y',
 6: 'g', 7: 'k', 8: 'tab:pink', 9: 'tab:gray'}
+cmap = ListedColormap(list(colors.values()))
+legend_handles = [Patch(color=c, label=str(j)) for j, c in colors.items()]
 
 latent_0, latent_1 = latent[0], latent[1]
 
@@ -68,10 +70,8 @@ projections = reducer.fit_transform(latent_0)
 
 fig=plt.figure(figsize=(8,6)) 
 ax1 = fig.add_subplot(1, 1, 1)
-ax1.scatter(projections[:,0], projections[:,1], c=pd.Series(target).map(colors))
+ax1.scatter(projections[:,0], projections[:,1], c=target.numpy(), cmap=cmap, vmin=0, vmax=9)
 ax1.set_title('mmVAE UMAP latent 0')
-handles, labels = plt.gca().get_legend_handles_labels()
-by_label = OrderedDict(zip(labels, handles))
-plt.legend(by_label.values(), by_label.keys())
+plt.legend(handles=legend_handles)
 plt.tight_layout()
 plt.show()
\ No newline at end of file
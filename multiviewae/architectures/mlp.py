@@ -6,6 +6,7 @@ import torch.nn as nn
 import torch.nn.functional as F
 
 from torch.nn import Parameter
+from ..base.exceptions import InputError
 
 class Encoder(nn.Module):
     """MLP Encoder
@@ -445,6 +446,10 @@ class ConditionalVariationalDecoder(Decoder):
         if (len(z.size()) == 3 and len(c.size()) == 2): # NOTE: for mmvae which uses rsample() instead of sample()
             z_cond = torch.cat((z, c.repeat(z.size()[0],1,1)), dim=2)
         else:
+            if z.size(0) != c.size(0): # NOTE: for mcvae which decodes the latents of all views stacked along the batch dimension
+                if z.size(0) % c.size(0) != 0:
+                    raise InputError("number of latents must be a multiple of the number of labels")
+                c = c.repeat(z.size(0) // c.size(0), *([1] * (c.dim() - 1)))
             z_cond = torch.hstack((z, c))
         
         x_rec = z_cond
@@ -1,5 +1,4 @@
 import os
-import numpy as np
 import hydra
 import re
 import collections.abc
@@ -32,6 +31,14 @@ def update_dict(d, u, l):
                 d[k] = v
     return d
 
+# nn.Module.compile() stores the compiled forward in the private _compiled_call_impl attribute and torch provides
+# no public counterpart to undo it, so these helpers are the only place that attribute is touched.
+def is_compiled(module):
+    return getattr(module, "_compiled_call_impl", None) is not None
+
+def uncompile(module):
+    module._compiled_call_impl = None
+
 class BaseModelAE(ABC, pl.LightningModule):
     """Base class for autoencoder models.
     Args:
@@ -132,6 +139,9 @@ class BaseModelAE(ABC, pl.LightningModule):
             raise InputError("no labels given for Conditional VAE")
 
         self._training = True
+        if self.compile_encoders and not hasattr(torch.nn.Module, "compile"):
+            raise ConfigError("model.compile_encoders requires torch>=2.2")
+
         if max_epochs is not None:
             self.max_epochs = max_epochs
             self.cfg.trainer.max_epochs = max_epochs
@@ -158,7 +168,16 @@ class BaseModelAE(ABC, pl.LightningModule):
            self.cfg.datamodule, data=data, n_views=self.n_views, labels=labels, _convert_="all", _recursive_=False
         )
 
-        py_trainer.fit(self, datamodule)
+        # the encoders are only compiled for the duration of training, prediction with varying batch sizes runs eagerly
+        if self.compile_encoders:
+            for enc in self.encoders:
+                enc.compile(mode="reduce-overhead", fullgraph=False, dynamic=False)
+        try:
+            py_trainer.fit(self, datamodule)
+        finally:
+            if self.compile_encoders:
+                for enc in self.encoders:
+                    uncompile(enc)
         
 
     def predict_latents(self, *data, input_modalities=None, labels=None, batch_size=None):
@@ -382,6 +401,10 @@ class BaseModelAE(ABC, pl.LightningModule):
                 if not bool(pattern.match(eval(f"cfg.decoder.{k}._target_"))):
                     raise ConfigError(f"{k}: must use non-variational Decoder if decoder dist is Default/Bernoulli.")
 
+            if "use_mse_ll" in eval(f"cfg.decoder.{k}.dec_dist") and \
+            eval(f"cfg.decoder.{k}.dec_dist._target_") != "multiviewae.base.distributions.Normal":
+                raise ConfigError(f"{k}: use_mse_ll is only supported for the Normal decoder dist.")
+
         if self.model_name in [MODEL_AE] + ADVERSARIAL_MODELS:
             pattern1 = re.compile(r'..*\.*VariationalEncoder')
             pattern2 = re.compile(r'multiviewae\.base\.distributions\..*Normal')
@@ -486,46 +509,64 @@ class BaseModelAE(ABC, pl.LightningModule):
             else:
                 batch_size = data[0].shape[0]
 
-        generator = DataLoader(dataset, batch_size=batch_size, shuffle=False)
+        is_cuda = self.device.type == "cuda"
+        generator = DataLoader(dataset, batch_size=batch_size, shuffle=False, pin_memory=is_cuda)
 
-        with torch.no_grad():
-            z_ = None
-            for batch_idx, local_batch in enumerate(generator):
-                local_batchx, local_batchy, _ = self._unpack_batch(local_batch)
-                self._set_batch_labels(local_batchy)
+        float_encoders = {}
+        if self.quantize_encoders:
+            if self.device.type != "cpu":
+                raise ConfigError("model.quantize_encoders is only supported on cpu")
+            for name in ["encoders", "private_encoders"]:
+                if hasattr(self, name):
+                    float_encoders[name] = getattr(self, name)
+                    setattr(self, name, torch.ao.quantization.quantize_dynamic(
+                        float_encoders[name], {torch.nn.Linear}, dtype=torch.qint8
+                    ))
 
-                local_batchx = [
-                    local_batchx_.to(self.device) for local_batchx_ in local_batchx
-                ]
-                if input_modalities is None:
-                    z = self.encode(local_batchx)
-                else:
-                    z = self.encode_subset(local_batchx, input_modalities)
-                if self.sparse:
-                    z = self.apply_threshold(z)
-                if is_recon:
-                    if output_modalities is None:
-                        z = self.decode(z)
-                    else:
-                        z = self.decode_subset(z, output_modalities)
-
-                z = [
-                        [ d__._sample().cpu().detach().numpy() for d__ in d_ ]
-                        if isinstance(d_, (list))
-                        else
-                        (d_.cpu().detach().numpy() if isinstance(d_, torch.Tensor)
-                        else d_._sample().cpu().detach().numpy())
-                        for d_ in z
+        try:
+            with torch.no_grad():
+                z_ = []
+                for batch_idx, local_batch in enumerate(generator):
+                    local_batchx, local_batchy, _ = self._unpack_batch(local_batch)
+                    self._set_batch_labels(local_batchy)
+
+                    local_batchx = [
+                        local_batchx_.to(self.device, non_blocking=is_cuda) for local_batchx_ in local_batchx
                     ]
-
-                if z_ is not None:
-                    z_ = [
-                            [ np.append(d_, d, axis=0) for d_, d in zip(p_,p) ]
-                            if isinstance(p_, list) else np.append(p_, p, axis=0)
-                            for p_, p in zip(z_, z)
-                         ]
-                else:
-                    z_ = z
+                    if input_modalities is None:
+                        z = self.encode(local_batchx)
+                    else:
+                        z = self.encode_subset(local_batchx, input_modalities)
+                    if self.sparse:
+                        z = self.apply_threshold(z)
+                    if is_recon:
+                        if output_modalities is None:
+                            z = self.decode(z)
+                        else:
+                            z = self.decode_subset(z, output_modalities)
+
+                    # queue the device to host copies without blocking, the device is synchronised once after the loop
+                    z = [
+                            [ d__._sample().detach().to("cpu", non_blocking=is_cuda) for d__ in d_ ]
+                            if isinstance(d_, (list))
+                            else
+                            (d_.detach().to("cpu", non_blocking=is_cuda) if isinstance(d_, torch.Tensor)
+                            else d_._sample().detach().to("cpu", non_blocking=is_cuda))
+                            for d_ in z
+                        ]
+                    z_.append(z)
+        finally:
+            for name, encoders in float_encoders.items():
+                setattr(self, name, encoders)
+        if is_cuda:
+            torch.cuda.synchronize(self.device)
+
+        # concatenate the batches once at the end rather than appending to the output at every batch
+        z_ = [
+                [ torch.cat(d_, dim=0).numpy() for d_ in zip(*p_) ]
+                if isinstance(p_[0], list) else torch.cat(p_, dim=0).numpy()
+                for p_ in zip(*z_)
+             ]
         return z_
 
     def predict_nll(self, *data, labels=None, batch_size=None):
@@ -1,5 +1,5 @@
 import torch
-from torch.distributions import Normal, kl_divergence, Laplace, Bernoulli
+from torch.distributions import Normal, kl_divergence, register_kl, Laplace, Bernoulli
 from torch.distributions.multivariate_normal import MultivariateNormal
 from torch.distributions.utils import broadcast_all
 from torch.nn.functional import binary_cross_entropy
@@ -8,7 +8,32 @@ import torch.nn.functional as F
 
 def compute_log_alpha(mu, logvar):
     # clamp because dropout rate p in 0-99%, where p = alpha/(alpha+1)
-    return (logvar - 2 * torch.log(torch.abs(mu) + 1e-8)).clamp(min=-8, max=8)
+    return (logvar - 2 * torch.log(torch.abs(mu) + 1e-8)).clamp(min=-8., max=8.)
+
+def _normal_kl_divergence(mu0, logvar0, mu1, logvar1):
+    return -0.5 * (1 - logvar0.exp()/logvar1.exp() - (mu0-mu1).pow(2)/logvar1.exp() + logvar0 - logvar1)
+
+def _sparse_kl_divergence(mu, logvar):
+    """
+    Implementation from: https://github.com/senya-ashukha/variational-dropout-sparsifies-dnn/blob/master/KL%20approximation.ipynb
+
+    """
+    log_alpha = compute_log_alpha(mu, logvar)
+    k1, k2, k3 = 0.63576, 1.8732, 1.48695
+    neg_KL = (
+        k1 * torch.sigmoid(k2 + k3 * log_alpha)
+        - 0.5 * torch.log1p(torch.exp(-log_alpha))
+        - k1
+    )
+    return -neg_KL
+
+def _upcast(x):
+    # upcast half precision tensors (e.g. under bf16 autocast) to float32, float32 and float64 are left unchanged
+    return x.to(torch.promote_types(x.dtype, torch.float32))
+
+def _reparameterise(loc, scale):
+    eps = torch.randn_like(loc)
+    return torch.addcmul(loc, eps, scale)
 
 class Default():
     """Artificial distribution designed for data with unspecified distribution.
@@ -89,12 +114,14 @@ class Normal(Normal):
     Args:
         loc (int, torch.Tensor): Mean of distribution.
         scale (int, torch.Tensor): Standard deviation of distribution.
+        use_mse_ll (bool): Whether to compute the log likelihood as -0.5 * squared error, i.e. assuming unit variance and dropping the constant term. Default is False.
     """
     def __init__(
         self,
         **kwargs,
     ):
         self.loc = kwargs['loc']
+        self.use_mse_ll = kwargs.get('use_mse_ll', False)
         if 'logvar' in kwargs:
             self.logvar = kwargs['logvar']
             self.scale = kwargs['logvar'].mul(0.5).exp_()
@@ -110,31 +137,20 @@ class Normal(Normal):
     def variance(self):
         return self.scale.pow(2)
 
-    def kl_divergence(self, other):
-        logvar0 = self.logvar
-        mu0 = self.loc
-        logvar1 = other.logvar
-        mu1 = other.loc
+    def rsample(self, sample_shape=torch.Size()):
+        shape = self._extended_shape(sample_shape)
+        return _reparameterise(self.loc.expand(shape), self.scale.expand(shape))
 
-        return -0.5 * (1 - logvar0.exp()/logvar1.exp() - (mu0-mu1).pow(2)/logvar1.exp() + logvar0 - logvar1)
+    def kl_divergence(self, other):
+        return kl_divergence(self, other)
     
     def sparse_kl_divergence(self):
-        """
-        Implementation from: https://github.com/senya-ashukha/variational-dropout-sparsifies-dnn/blob/master/KL%20approximation.ipynb
-
-        """
-        mu = self.loc
-        logvar = torch.log(self.variance)
-        log_alpha = compute_log_alpha(mu, logvar)
-        k1, k2, k3 = 0.63576, 1.8732, 1.48695
-        neg_KL = (
-            k1 * torch.sigmoid(k2 + k3 * log_alpha)
-            - 0.5 * torch.log1p(torch.exp(-log_alpha))
-            - k1
-        )
-        return -neg_KL
+        return _sparse_kl_divergence(_upcast(self.loc), _upcast(self.logvar))
 
     def log_likelihood(self, x):
+        if self.use_mse_ll:
+            loc, x = broadcast_all(self.loc, x)
+            return -0.5 * F.mse_loss(loc, x, reduction='none')
         return self.log_prob(x)
 
     def _sample(self, *kwargs, training=False, return_mean=True):
@@ -145,6 +161,11 @@ class Normal(Normal):
                 return self.loc
         return self.rsample()
 
+@register_kl(Normal, Normal)
+def _kl_normal_normal(p, q):
+    # computed in at least float32 as the log terms lose precision under bf16 autocast
+    return _normal_kl_divergence(_upcast(p.loc), _upcast(p.logvar), _upcast(q.loc), _upcast(q.logvar))
+
 class MultivariateNormal(MultivariateNormal):
     """Multivariate normal distribution with diagonal covariance matrix. Inherits from torch.distributions.multivariate_normal.MultivariateNormal.
 
@@ -186,14 +207,7 @@ class MultivariateNormal(MultivariateNormal):
     def sparse_kl_divergence(self):
         mu = self.loc
         logvar = torch.log(self.variance)
-        log_alpha = compute_log_alpha(mu, logvar)
-        k1, k2, k3 = 0.63576, 1.8732, 1.48695
-        neg_KL = (
-            k1 * torch.sigmoid(k2 + k3 * log_alpha)
-            - 0.5 * torch.log1p(torch.exp(-log_alpha))
-            - k1
-        )
-        return -neg_KL
+        return _sparse_kl_divergence(mu, logvar)
 
     def log_likelihood(self, x):
         ll = self.log_prob(x)
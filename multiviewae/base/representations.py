@@ -17,6 +17,22 @@ class ProductOfExperts(nn.Module):
         pd_var = 1.0 / torch.sum(T, dim=0)
         pd_logvar = torch.log(pd_var)
         return pd_mu, pd_logvar
+
+    def accumulate(self, mu, logvar, acc=None):
+        """Add a single expert to the running sums of mu * T and T, avoiding an M x D stack of experts."""
+        var = torch.exp(logvar) + EPS
+        T = 1.0 / var
+        if acc is None:
+            return mu * T, T
+        return acc[0] + mu * T, acc[1] + T
+
+    def finalise(self, acc, n_experts):
+        """Return the product of experts parameters from the running sums returned by accumulate().
+        n_experts is unused and only kept so that the signature matches MeanRepresentation.finalise()."""
+        pd_var = 1.0 / acc[1]
+        pd_mu = acc[0] * pd_var
+        pd_logvar = torch.log(pd_var)
+        return pd_mu, pd_logvar
     
 class alphaProductOfExperts(nn.Module):
     """Return parameters for weighted product of independent experts (mmJSD implementation).
@@ -106,3 +122,13 @@ class MeanRepresentation(nn.Module):
         mean_logvar = torch.mean(logvar, axis=0)
         
         return mean_mu, mean_logvar
+
+    def accumulate(self, mu, logvar, acc=None):
+        """Add a single view to the running sums of mu and logvar, avoiding an M x D stack of views."""
+        if acc is None:
+            return mu, logvar
+        return acc[0] + mu, acc[1] + logvar
+
+    def finalise(self, acc, n_experts):
+        """Return the mean representation from the running sums returned by accumulate()."""
+        return acc[0] / n_experts, acc[1] / n_experts
@@ -76,7 +76,9 @@ config_schema = Schema({
         Optional("alpha"): And(Or(int, float), lambda x: x > 0),
         Optional("private"): bool,
         Optional("join_type"): eval(return_or(params=SUPPORTED_JOIN,
-                        msg="model.join_type: unsupported or invalid join type"))
+                        msg="model.join_type: unsupported or invalid join type")),
+        Optional("compile_encoders"): bool,
+        Optional("quantize_encoders"): bool
     },
     "datamodule": {
         "_target_": Regex(r'(.*?)DataModule$'),   
@@ -134,7 +136,8 @@ config_schema = Schema({
             Optional("init_logvar"): Or(int, float),
             "dec_dist": {
                     "_target_": eval(return_regexor(params=SUPPORTED_DISTRIBUTIONS,
-                            msg="decoder.dec_dist._target_: unsupported or invalid decoder distribution"))
+                            msg="decoder.dec_dist._target_: unsupported or invalid decoder distribution")),
+                    Optional("use_mse_ll"): bool
             }
         },
         Optional(Regex(r'^dec\d$')) : {
@@ -150,7 +153,8 @@ config_schema = Schema({
             Optional("init_logvar"): Or(int, float),
             "dec_dist": {
                     "_target_": eval(return_regexor(params=SUPPORTED_DISTRIBUTIONS,
-                            msg="decoder.dec_dist._target_: unsupported or invalid decoder distribution"))
+                            msg="decoder.dec_dist._target_: unsupported or invalid decoder distribution")),
+                    Optional("use_mse_ll"): bool
             }
         }
     },
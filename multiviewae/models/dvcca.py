@@ -1,5 +1,6 @@
 import torch
 import hydra
+from torch.distributions import kl_divergence
 from ..base.constants import MODEL_DVCCA
 from ..base.base_model import BaseModelVAE
 
@@ -65,8 +66,14 @@ class DVCCA(BaseModelVAE):
                 )
             ]
         )
+        # resolve the encoding distributions once rather than instantiating them from the config at every forward pass
+        self.enc_dist = hydra.utils.instantiate(self.cfg.encoder.default.enc_dist, _partial_=True)
 
         if self.private:
+            self.private_enc_dists = [
+                hydra.utils.instantiate(self.cfg.encoder[f"enc{i}"].enc_dist, _partial_=True)
+                for i in range(len(self.input_dim))
+            ]
 
             self.private_encoders = torch.nn.ModuleList(
                 [
@@ -89,37 +96,6 @@ class DVCCA(BaseModelVAE):
                     torch.FloatTensor(1, self.z_dim).normal_(0, 0.01)
                 )
 
-    def configure_optimizers(self):
-        r"""Configure optimizers for encoder, private encoder, and decoder network parameters.
-
-        Returns:
-            optimizers (list): list of Adam optimizers for encoders and decoders.
-        """
-        if self.private:
-            optimizers = [
-                torch.optim.Adam(self.encoders[0].parameters(), lr=self.learning_rate)
-            ] + [
-                torch.optim.Adam(
-                    list(self.private_encoders[i].parameters()), lr=self.learning_rate
-                )
-                for i in range(self.n_views)
-            ] + [
-                torch.optim.Adam(
-                    list(self.decoders[i].parameters()), lr=self.learning_rate
-                )
-                for i in range(self.n_views)
-            ]
-        else:
-            optimizers = [
-                torch.optim.Adam(self.encoders[0].parameters(), lr=self.learning_rate)
-            ] + [
-                torch.optim.Adam(
-                    list(self.decoders[i].parameters()), lr=self.learning_rate
-                )
-                for i in range(self.n_views)
-            ]
-        return optimizers
-
     def encode(self, x):
         r"""Forward pass through encoder network. For DVCCA-private a forward pass is performed through each private encoder and the output latent is concatenated with the shared latent.
 
@@ -134,33 +110,30 @@ class DVCCA(BaseModelVAE):
 
         """
         mu, logvar = self.encoders[0](x[0])
-        qz_x = hydra.utils.instantiate(
-                    eval(f"self.cfg.encoder.enc0.enc_dist"), loc=mu, logvar=logvar
-        )
         if self.private:
             qz_xs = []
             qh_xs = []
+            mu_p = []
+            logvar_p = []
             for i in range(self.n_views):
-                mu_p, logvar_p = self.private_encoders[i](x[i])
-                qh_x = hydra.utils.instantiate(
-                    eval(f"self.cfg.encoder.enc{i}.enc_dist"), loc=mu_p, logvar=logvar_p
-                )
+                mu_p_, logvar_p_ = self.private_encoders[i](x[i])
+                qh_x = self.private_enc_dists[i](loc=mu_p_, logvar=logvar_p_)
                 qh_xs.append(qh_x)
+                mu_p.append(mu_p_)
+                logvar_p.append(logvar_p_)
 
-                mu_ = torch.cat((mu, mu_p), 1)
-                logvar_ = torch.cat((logvar, logvar_p), 1)
+            # concatenate the shared latent with the private latents of all views at once: n_views x batch_size x 2*z_dim
+            mu_ = torch.cat((mu.expand(self.n_views, -1, -1), torch.stack(mu_p)), -1)
+            logvar_ = torch.cat((logvar.expand(self.n_views, -1, -1), torch.stack(logvar_p)), -1)
 
-                qz_x = hydra.utils.instantiate(
-                    eval(f"self.cfg.encoder.enc{i}.enc_dist"), loc=mu_, logvar=logvar_
-                )
+            for i in range(self.n_views):
+                qz_x = self.private_enc_dists[i](loc=mu_[i], logvar=logvar_[i])
                 qz_xs.append(qz_x)
             if self._training:
                 return [[qz_x], qz_xs, qh_xs]
             return qz_xs
         else:
-            qz_x = hydra.utils.instantiate( 
-                self.cfg.encoder.default.enc_dist, loc=mu, logvar=logvar
-            )
+            qz_x = self.enc_dist(loc=mu, logvar=logvar)
             return [qz_x]
 
     def decode(self, qz_x):
@@ -251,7 +224,7 @@ class DVCCA(BaseModelVAE):
         """
         if self.sparse:
             return dist.sparse_kl_divergence().mean(0).sum()
-        return dist.kl_divergence(self.prior).mean(0).sum()
+        return kl_divergence(dist, self.prior).mean(0).sum()
 
     def calc_ll(self, x, px_zs):
         r"""Calculate log-likelihood loss.
@@ -79,6 +79,25 @@ class mcVAE(BaseModelVAE):
             del px_z
         return px_zs
 
+    def decode_stacked(self, qz_xs):
+        r"""Forward pass through decoder networks with the latents of all views stacked along the batch dimension, 
+        so that each decoder is called once rather than once per latent.
+
+        Args:
+            qz_xs (list): list of encoding distributions for each view.
+
+        Returns:
+            px_zs (list): list of n_view decoding distributions with the position in the list indicating the decoder index. 
+            Each distribution covers the n_view latents stacked along the batch dimension.
+        """
+        # each decoder gets its own sample of every latent, drawn in the same order as decode()
+        zs = [
+            [qz_x._sample(training=self._training, return_mean=self.return_mean) for _ in range(self.n_views)]
+            for qz_x in qz_xs
+        ]
+        px_zs = [self.decoders[i](torch.cat([z[i] for z in zs])) for i in range(self.n_views)]
+        return px_zs
+
     def forward(self, x):
         r"""Apply encode and decode methods to input data to generate latent dimensions and data reconstructions. 
         
@@ -89,7 +108,7 @@ class mcVAE(BaseModelVAE):
             fwd_rtn (dict): dictionary containing encoding (qz_xs) and decoding (px_zs) distributions.
         """
         qz_xs = self.encode(x)
-        px_zs = self.decode(qz_xs)
+        px_zs = self.decode_stacked(qz_xs)
         fwd_rtn = {"px_zs": px_zs, "qz_xs": qz_xs}
         return fwd_rtn
 
@@ -133,13 +152,18 @@ class mcVAE(BaseModelVAE):
 
         Args:
             x (list): list of input data of type torch.Tensor.
-            px_zs (list): list of decoding distributions.
+            px_zs (list): list of decoding distributions returned by decode_stacked, or the nested list returned by decode.
 
         Returns:
             ll (torch.Tensor): Log-likelihood loss.
         """
         ll = 0
+        if isinstance(px_zs[0], list):
+            for i in range(self.n_views):
+                for j in range(self.n_views):
+                    ll += px_zs[j][i].log_likelihood(x[i]).mean(0).sum() #first index is latent, second index is view
+            return ll/self.n_views/self.n_views
         for i in range(self.n_views):
-            for j in range(self.n_views):
-                ll += px_zs[j][i].log_likelihood(x[i]).mean(0).sum() #first index is latent, second index is view
-        return ll/self.n_views/self.n_views
+            x_ = torch.cat([x[i]] * self.n_views) #repeat input for each latent stacked along the batch dimension
+            ll += px_zs[i].log_likelihood(x_).mean(0).sum()
+        return ll/self.n_views
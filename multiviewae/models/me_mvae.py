@@ -88,7 +88,7 @@ class me_mVAE(BaseModelVAE):
             #get mu and logvar from prior expert
             mu_ = self.prior.mean
             mu_ = mu_.expand(mu[0].shape).to(mu[0].device)            
-            logvar_ = torch.log(self.prior.variance).to(mu[0].device)
+            logvar_ = self.prior.logvar.to(mu[0].device)
             logvar_ = logvar_.expand(logvar[0].shape)              
             mu.append(mu_)
             logvar.append(logvar_)
@@ -121,7 +121,7 @@ class me_mVAE(BaseModelVAE):
             #get mu and logvar from prior expert
             mu_ = self.prior.mean
             mu_ = mu_.expand(mu[0].shape).to(mu[0].device)           
-            logvar_ = torch.log(self.prior.variance).to(mu[0].device)     
+            logvar_ = self.prior.logvar.to(mu[0].device)     
             logvar_ = logvar_.expand(logvar[0].shape)      
             mu.append(mu_)
             logvar.append(logvar_)
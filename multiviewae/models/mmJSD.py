@@ -136,7 +136,7 @@ class mmJSD(BaseModelVAE):
         #add prior expert
         mu_ = self.prior.mean
         mu_ = mu_.expand(mu[0].shape).to(mu[0].device)           
-        logvar_ = torch.log(self.prior.variance).to(mu[0].device)     
+        logvar_ = self.prior.logvar.to(mu[0].device)     
         logvar_ = logvar_.expand(logvar[0].shape)
         qz_x = hydra.utils.instantiate(
             eval(f"self.cfg.encoder.enc{i}.enc_dist"), loc=mu_, logvar=logvar_
@@ -188,7 +188,7 @@ class mmJSD(BaseModelVAE):
         if len(subset) > 1:
             mu_ = self.prior.mean
             mu_ = mu_.expand(mu[0].shape).to(mu[0].device)           
-            logvar_ = torch.log(self.prior.variance).to(mu[0].device)     
+            logvar_ = self.prior.logvar.to(mu[0].device)     
             logvar_ = logvar_.expand(logvar[0].shape)
             mu.append(mu_)
             logvar.append(logvar_)
@@ -270,7 +270,7 @@ class mmJSD(BaseModelVAE):
         """
         kl = 0
         for i in range(len(qz_xs)):
-            kl += qz_xs[i].kl_divergence(self.prior).sum(1, keepdims=True).mean(0)
+            kl += qz_xs[i].kl_divergence(self.prior).sum(1).mean()
         return self.beta*kl/self.n_views
 
     def calc_ll(self, x, px_zs):
@@ -300,7 +300,7 @@ class mmJSD(BaseModelVAE):
         """
         jsd = 0
         for i in range(self.n_views):
-            jsd += qcs_xs[i].kl_divergence(qc_x[0]).sum(1, keepdims=True).mean(0)
+            jsd += qcs_xs[i].kl_divergence(qc_x[0]).sum(1).mean()
         return self.alpha*jsd/(self.n_views+1)
 
     def loss_function(self, x, fwd_rtn):
@@ -75,7 +75,7 @@ class MoPoEVAE(BaseModelVAE):
                 if len(subset) == self.n_views:
                     mu_ = self.prior.mean
                     mu_ = mu_.expand(mu[0].shape).to(mu[0].device)           
-                    logvar_ = torch.log(self.prior.variance).to(mu[0].device)     
+                    logvar_ = self.prior.logvar.to(mu[0].device)     
                     logvar_ = logvar_.expand(logvar[0].shape)
                     mu_ = mu_.unsqueeze(0)
                     logvar_ = logvar_.unsqueeze(0)
@@ -107,7 +107,7 @@ class MoPoEVAE(BaseModelVAE):
               
             mu_ = self.prior.mean
             mu_ = mu_.expand(mu[0].shape).to(mu[0].device)           
-            logvar_ = torch.log(self.prior.variance).to(mu[0].device)     
+            logvar_ = self.prior.logvar.to(mu[0].device)     
             logvar_ = logvar_.expand(logvar[0].shape)
             mu_out.append(mu_)
             logvar_out.append(logvar_)
@@ -142,7 +142,7 @@ class MoPoEVAE(BaseModelVAE):
         if len(subset) == self.n_views:
             mu_ = self.prior.mean
             mu_ = mu_.expand(mu[0].shape).to(mu[0].device)           
-            logvar_ = torch.log(self.prior.variance).to(mu[0].device)     
+            logvar_ = self.prior.logvar.to(mu[0].device)     
             logvar_ = logvar_.expand(logvar[0].shape)
             mu.append(mu_)
             logvar.append(logvar_)
@@ -78,28 +78,7 @@ class mVAE(BaseModelVAE):
         Returns:
             (list): Single element list of joint encoding distribution.
         """
-        mu = []
-        logvar = []
-        for i in range(self.n_views):
-            mu_, logvar_ = self.encoders[i](x[i])
-            mu.append(mu_)
-            logvar.append(logvar_)
-        if not self.sparse and self.use_prior:
-            #get mu and logvar from prior expert
-            mu_ = self.prior.mean
-            mu_ = mu_.expand(mu[0].shape).to(mu[0].device)           
-            logvar_ = torch.log(self.prior.variance).to(mu[0].device)     
-            logvar_ = logvar_.expand(logvar[0].shape)      
-            mu.append(mu_)
-            logvar.append(logvar_)
-        mu = torch.stack(mu)
-        logvar = torch.stack(logvar)
-        mu_out, logvar_out = self.join_z(mu, logvar)
-    
-        qz_x = hydra.utils.instantiate(
-            self.cfg.encoder.default.enc_dist, loc=mu_out, logvar=logvar_out
-        )
-        return [qz_x]
+        return self.encode_subset(x, range(self.n_views))
 
     def encode_subset(self, x, subset):
         r"""Forward pass through encoder networks for the specified subset.
@@ -110,23 +89,22 @@ class mVAE(BaseModelVAE):
         Returns:
             (list): Single element list of joint encoding distribution.
         """
-        mu = []
-        logvar = []
+        acc = None
+        n_experts = 0
         for i in subset:
             mu_, logvar_ = self.encoders[i](x[i])
-            mu.append(mu_)
-            logvar.append(logvar_)
+            acc = self.join_z.accumulate(mu_, logvar_, acc)
+            n_experts += 1
         if not self.sparse and self.use_prior:
             #get mu and logvar from prior expert
+            shape, device = mu_.shape, mu_.device
             mu_ = self.prior.mean
-            mu_ = mu_.expand(mu[0].shape).to(mu[0].device)           
-            logvar_ = torch.log(self.prior.variance).to(mu[0].device)     
-            logvar_ = logvar_.expand(logvar[0].shape)      
-            mu.append(mu_)
-            logvar.append(logvar_)
-        mu = torch.stack(mu)
-        logvar = torch.stack(logvar)
-        mu_out, logvar_out = self.join_z(mu, logvar)
+            mu_ = mu_.expand(shape).to(device)           
+            logvar_ = self.prior.logvar.to(device)     
+            logvar_ = logvar_.expand(shape)      
+            acc = self.join_z.accumulate(mu_, logvar_, acc)
+            n_experts += 1
+        mu_out, logvar_out = self.join_z.finalise(acc, n_experts)
     
         qz_x = hydra.utils.instantiate(
             self.cfg.encoder.default.enc_dist, loc=mu_out, logvar=logvar_out
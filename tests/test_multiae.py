@@ -226,6 +226,8 @@ def test_validation():
             "./user_config/validation_variational2.yaml": VARIATIONAL_MODELS, #encoding and prior distribution must be the same type
             "./user_config/validation_prior1.yaml": MODELS, #can't have different scale inputs for Normal prior distribution
             "./user_config/validation_prior2.yaml": VARIATIONAL_MODELS, #prior dimension and z dimension must be the same
+            "./user_config/validation_compile.yaml": MODELS, #compile_encoders must be a boolean
+            "./user_config/validation_mse_ll.yaml": VARIATIONAL_MODELS, #use_mse_ll is only supported for Normal decoder dist
             }
 
     module = importlib.import_module("multiviewae")
@@ -583,6 +585,198 @@ def test_weightings():
             outdir = model1.cfg.out_dir
             if os.path.exists(outdir):
                 shutil.rmtree(outdir)
+
+def test_compile_encoders():
+    """
+    Tests compiling the encoders during fit(). The test will fail if the encoders are still compiled after fit() returns
+    or if the saved model.pkl cannot be loaded and used for prediction.
+    """
+    from multiviewae.base.base_model import is_compiled
+
+    np.random.seed(0)
+    train_1 = np.random.rand(200, 20)
+    train_2 = np.random.rand(200, 10)
+
+    tests = {
+            "./user_config/compile_encoders.yaml": [[20, 10], [MODEL_MVAE, MODEL_DVCCA, MODEL_AE]],
+            }
+    module = importlib.import_module("multiviewae")
+    for cfg, [dim, models] in tests.items():
+        for m in models:
+            class_ = getattr(module, m)
+            model = class_(cfg=abspath(join(dirname( __file__ ), cfg)), input_dim=dim)
+            model.fit(train_1, train_2, max_epochs=2, batch_size=50)
+            assert not any(is_compiled(enc) for enc in model.encoders)
+
+            print("RESULTS: ", m)
+            loaded_model = torch.load(join(model.cfg.out_dir, "model.pkl"), weights_only=False)
+            latent = loaded_model.predict_latents(train_1, train_2, batch_size=30)
+            print_results("latent model.pkl", latent)
+
+            outdir = model.cfg.out_dir
+            if os.path.exists(outdir):
+                shutil.rmtree(outdir)
+
+def test_quantize_encoders():
+    """
+    Tests predicting with dynamically quantized encoders. The test will fail if predict_latents() fails with the quantized encoders,
+    if the latents differ substantially from those of the float encoders or if the float encoders are not restored afterwards.
+    """
+    np.random.seed(0)
+    train_1 = np.random.rand(200, 20)
+    train_2 = np.random.rand(200, 10)
+
+    tests = {
+            "./user_config/quantize_encoders.yaml": [[20, 10], [MODEL_MVAE, MODEL_DVCCA, MODEL_AE]],
+            "./user_config/quantize_encoders_private.yaml": [[20, 10], [MODEL_DVCCA]], #quantizes the private encoders of DVCCA
+            }
+    module = importlib.import_module("multiviewae")
+    for cfg, [dim, models] in tests.items():
+        for m in models:
+            class_ = getattr(module, m)
+            model = class_(cfg=abspath(join(dirname( __file__ ), cfg)), input_dim=dim)
+            model.fit(train_1, train_2, max_epochs=2, batch_size=50)
+
+            encoders = [model.encoders] + ([model.private_encoders] if hasattr(model, "private_encoders") else [])
+            latent = model.predict_latents(train_1, train_2, batch_size=30)
+            assert [model.encoders] + ([model.private_encoders] if hasattr(model, "private_encoders") else []) == encoders
+            assert not any(type(l).__module__.startswith("torch.ao") for enc in encoders for l in enc.modules())
+
+            model.quantize_encoders = False
+            latent_float = model.predict_latents(train_1, train_2, batch_size=30)
+            for z, z_float in zip(latent, latent_float):
+                assert np.allclose(z, z_float, atol=0.1)
+
+            print("RESULTS: ", m)
+            print_results("latent", latent)
+
+            outdir = model.cfg.out_dir
+            if os.path.exists(outdir):
+                shutil.rmtree(outdir)
+
+def test_mcvae_decode_stacked():
+    """
+    Tests that the mcVAE log-likelihood of the stacked decoding distributions returned by decode_stacked() equals the nested
+    reduction over every latent and decoder returned by decode(), for plain and conditional decoders.
+    """
+    torch.manual_seed(0)
+    x = [torch.rand(50, 20), torch.rand(50, 10)]
+    labels = torch.randint(0, 3, (50,))
+
+    for cfg in ["", "./user_config/condae.yaml"]:
+        if len(cfg) != 0:
+            model = mcVAE(cfg=abspath(join(dirname( __file__ ), cfg)), input_dim=[20, 10])
+            model._set_batch_labels(labels)
+        else:
+            model = mcVAE(input_dim=[20, 10])
+
+        with torch.no_grad():
+            qz_xs = model.encode(x)
+
+            model._training = False #use the mean of the encoding distributions
+            px_zs = model.decode(qz_xs)
+            ll_nested = 0
+            for i in range(model.n_views):
+                for j in range(model.n_views):
+                    ll_nested += px_zs[j][i].log_likelihood(x[i]).mean(0).sum()
+            ll_nested = ll_nested/model.n_views/model.n_views
+            assert torch.allclose(model.calc_ll(x, model.decode_stacked(qz_xs)), ll_nested)
+            assert torch.allclose(model.calc_ll(x, px_zs), ll_nested)
+
+            model._training = True #each decoder draws its own samples in the same order as decode()
+            torch.manual_seed(1)
+            ll_stacked = model.calc_ll(x, model.decode_stacked(qz_xs))
+            torch.manual_seed(1)
+            assert torch.allclose(ll_stacked, model.calc_ll(x, model.decode(qz_xs)))
+
+def test_representations():
+    """
+    Tests that accumulating the experts one at a time with accumulate() and finalise() gives the same joint
+    representation as forward() on the stacked experts.
+    """
+    from multiviewae.base.representations import ProductOfExperts, MeanRepresentation
+
+    torch.manual_seed(0)
+    mu = [torch.randn(50, 5) for _ in range(3)]
+    logvar = [torch.randn(50, 5) for _ in range(3)]
+    for join_z in [ProductOfExperts(), MeanRepresentation()]:
+        acc = None
+        for mu_, logvar_ in zip(mu, logvar):
+            acc = join_z.accumulate(mu_, logvar_, acc)
+        mu_acc, logvar_acc = join_z.finalise(acc, len(mu))
+        mu_fwd, logvar_fwd = join_z(torch.stack(mu), torch.stack(logvar))
+        assert torch.allclose(mu_acc, mu_fwd, atol=1e-6)
+        assert torch.allclose(logvar_acc, logvar_fwd, atol=1e-6)
+
+def test_normal_kl():
+    """
+    Tests the analytic KL-divergence registered for the Normal distribution against the closed form formula and
+    torch's own Normal KL-divergence, for distributions built from logvar and from scale (e.g. the prior).
+    """
+    from multiviewae.base.distributions import Normal
+
+    torch.manual_seed(0)
+    mu, logvar = torch.randn(50, 5), torch.randn(50, 5)
+    qz_x = Normal(loc=mu, logvar=logvar)
+    priors = [Normal(loc=0., scale=1.), Normal(loc=torch.randn(5), scale=torch.rand(5) + 0.5)]
+    for prior in priors:
+        kl = torch.distributions.kl_divergence(qz_x, prior)
+        prior_logvar = torch.log(prior.scale.pow(2))
+        kl_formula = -0.5 * (1 - logvar.exp()/prior_logvar.exp() - (mu - prior.loc).pow(2)/prior_logvar.exp() + logvar - prior_logvar)
+        kl_torch = torch.distributions.kl_divergence(torch.distributions.Normal(mu, logvar.mul(0.5).exp()),
+                            torch.distributions.Normal(prior.loc, prior.scale))
+        assert kl.shape == kl_formula.shape
+        assert torch.allclose(kl, kl_formula, atol=1e-5)
+        assert torch.allclose(kl, kl_torch, atol=1e-5)
+        assert torch.allclose(qz_x.kl_divergence(prior), kl)
+
+    #float64 distributions keep their precision and half precision distributions are upcast to float32
+    for dtype, kl_dtype in [(torch.float64, torch.float64), (torch.bfloat16, torch.float32)]:
+        qz_x = Normal(loc=mu.to(dtype), logvar=logvar.to(dtype))
+        prior = Normal(loc=torch.zeros(5, dtype=dtype), scale=torch.ones(5, dtype=dtype))
+        kl = torch.distributions.kl_divergence(qz_x, prior)
+        assert kl.dtype == kl_dtype
+        assert qz_x.sparse_kl_divergence().dtype == kl_dtype
+        if dtype == torch.float64:
+            kl_formula = -0.5 * (1 - qz_x.logvar.exp() - qz_x.loc.pow(2) + qz_x.logvar)
+            assert torch.allclose(kl, kl_formula)
+
+def test_mse_ll():
+    """
+    Tests the MSE log likelihood of the Normal decoding distribution. The test will fail if the log likelihood does not equal
+    -0.5 * squared error when use_mse_ll is set or if fitting a model with use_mse_ll set in the configuration file fails.
+    """
+    from multiviewae.base.distributions import Normal
+
+    torch.manual_seed(0)
+    loc, x = torch.randn(50, 10), torch.randn(50, 10)
+    px_z = Normal(loc=loc, scale=torch.rand(10) + 0.5, use_mse_ll=True)
+    assert torch.allclose(px_z.log_likelihood(x), -0.5 * (loc - x)**2)
+    px_z = Normal(loc=loc.expand(3, -1, -1), scale=1., use_mse_ll=True) #K samples as in mmVAE
+    assert torch.allclose(px_z.log_likelihood(x), -0.5 * (loc - x).expand(3, -1, -1)**2)
+
+    np.random.seed(0)
+    train_1 = np.random.rand(200, 20)
+    train_2 = np.random.rand(200, 10)
+
+    tests = {
+            "./user_config/mse_ll.yaml": [[20, 10], [MODEL_MVAE, MODEL_MCVAE, MODEL_DVCCA, MODEL_MMVAE]],
+            }
+    module = importlib.import_module("multiviewae")
+    for cfg, [dim, models] in tests.items():
+        for m in models:
+            class_ = getattr(module, m)
+            model = class_(cfg=abspath(join(dirname( __file__ ), cfg)), input_dim=dim)
+            model.fit(train_1, train_2, max_epochs=2, batch_size=50)
+
+            print("RESULTS: ", m)
+            recon = model.predict_reconstruction(train_1, train_2)
+            print_results("recon", recon)
+
+            outdir = model.cfg.out_dir
+            if os.path.exists(outdir):
+                shutil.rmtree(outdir)
+
 if __name__ == "__main__":
     test_models()
     test_userconfig()
@@ -594,3 +788,9 @@ if __name__ == "__main__":
     test_fitconfig()
     test_conditionalVAE()
     test_weightings()
+    test_compile_encoders()
+    test_quantize_encoders()
+    test_mcvae_decode_stacked()
+    test_representations()
+    test_normal_kl()
+    test_mse_ll()